@@ -1,10 +1,15 @@
 import os
+import asyncio
+import functools
 import logging
+import re
 import sqlite3
 import threading
-from datetime import datetime
+import time
+from collections import OrderedDict, defaultdict
 from typing import Optional, List, Dict, Any
-from contextlib import contextmanager
+from contextlib import asynccontextmanager
+import aiosqlite
 import phonenumbers
 from phonenumbers import NumberParseException
 
@@ -17,37 +22,151 @@ from telegram.ext import (
     ChatJoinRequestHandler, ContextTypes, filters, PicklePersistence
 )
 from telegram.constants import ChatMemberStatus, ParseMode
-from telegram.error import Forbidden, BadRequest
+from telegram.error import Forbidden, BadRequest, RetryAfter
+from telegram.request import HTTPXRequest
 
 # Configure logging
 logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     level=logging.INFO
 )
+# The HTTP and Bot API libraries log every request at INFO; keep them to
+# warnings so polling doesn't flood the log.
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("telegram").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # Configuration
 BOT_TOKEN = os.getenv('BOT_TOKEN')
 ADMIN_ID = int(os.getenv('ADMIN_ID', '0'))
 
+# Per-connection SQLite tuning: WAL lets readers run concurrently with the
+# writer, NORMAL sync is safe under WAL, and the rest trims I/O on small,
+# frequent queries. journal_mode is persistent but cheap to re-issue.
+PRAGMA_SCRIPT = '''
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=134217728;
+    PRAGMA cache_size=-20000;
+    PRAGMA foreign_keys=ON;
+    PRAGMA busy_timeout=5000;
+'''
+
+# Static message templates, built once at import time; only the small
+# dynamic fields are interpolated per send.
+VERIFICATION_PROMPT_TMPL = (
+    "🇵🇭 *Filipino Verification*\n\nHi {first_name}! To join our exclusive Filipino groups, "
+    "please verify your identity by sharing your Philippine phone number."
+)
+VERIFY_SUCCESS_TMPL = (
+    "✅ **VERIFIED!** 🇵🇭\n\nWelcome, {first_name}!\n\nYour number {formatted_number} is verified. "
+    "You now have access to all our groups and will be auto-approved.\n\n{groups}"
+)
+VERIFY_FAIL_TMPL = (
+    "❌ **Verification Failed**\n\nThe number you provided ({formatted_number}) is not recognized "
+    "as a Philippine number. Please try again with a valid PH number."
+)
+AUTO_APPROVED_TMPL = (
+    "🎉 **Automatically Approved!**\n\nYou've been approved to join **{chat_title}** "
+    "since you're now a verified Filipino user! 🇵🇭"
+)
+JOIN_WELCOME_TMPL = (
+    "✅ Welcome to **{chat_title}**! You've been automatically approved as a verified Filipino user. 🇵🇭"
+)
+PENDING_VERIFICATION_TMPL = (
+    "⏳ **Verification Required for {chat_title}**\n\nHi {first_name}! Your join request is **pending**.\n\n"
+    "To get automatically approved, you need to verify your Philippine phone number first.\n\n"
+    "👉 Start verification by messaging me with /start\n\n"
+    "✅ Once verified, you'll be **automatically approved** without needing to request again!"
+)
+ALREADY_VERIFIED_TMPL = (
+    "✅ *Na-verify ka na!*\n\n{groups}"
+)
+HELP_TEXT = (
+    "🤖 **Bot Commands:**\n\n`/start` - Start the verification process.\n"
+    "`/groups` - View available Filipino groups (for verified users).\n`/help` - Show this help message."
+)
+HELP_ADMIN_SUFFIX = (
+    "\n\n**Admin Commands:**\n`/ban <user_id>` - Ban a user\n"
+    "`/manage_groups` - Manage groups\n`/stats` - Show bot statistics"
+)
+MANAGE_GROUPS_HELP = """🏢 **Group Management Commands:**
+
+**Add Group:**
+`/manage_groups add "Group Name" "Description" "https://t.me/grouplink"`
+
+**Remove Group:**
+`/manage_groups remove <group_id>`
+
+**List Groups:**
+`/manage_groups list`
+
+**Refresh Cache:**
+`/manage_groups refresh`
+"""
+# Immutable reply-markup objects, built once and reused across sends.
+KEYBOARD_REMOVE = ReplyKeyboardRemove()
+CONTACT_KEYBOARD = ReplyKeyboardMarkup(
+    [[KeyboardButton("📱 Share My Phone Number", request_contact=True)]],
+    one_time_keyboard=True, resize_keyboard=True
+)
+
+STATS_TMPL = """📊 **Bot Statistics**
+
+👥 **Users:**
+• Verified: {verified_count}
+• Banned: {banned_count}
+
+🏢 **Groups:** {groups_count}
+
+⏳ **Pending Join Requests:** {pending_requests}
+"""
+
 class DatabaseManager:
     """Manages all interactions with the SQLite database using best practices."""
     def __init__(self, db_path: str = "filipino_bot.db"):
         self.db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._conn_lock = asyncio.Lock()
+        # Bounded LRU of user_id -> (verified bit, cached-at), so the
+        # join-request hot path usually skips SQLite entirely. Writers keep
+        # it in sync; the TTL is a backstop against external DB edits.
+        self._verified_cache: OrderedDict[int, tuple] = OrderedDict()
+        self._verified_cache_max = 50000
+        self._verified_cache_ttl = 300
         self.init_database()
 
-    @contextmanager
-    def get_conn(self):
-        """Provides a database connection using a context manager to ensure it's always closed."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            yield conn
-        finally:
-            conn.close()
+    @asynccontextmanager
+    async def get_conn(self):
+        """Yields a shared long-lived connection, opened on first use.
+
+        aiosqlite serializes all operations for a connection on its worker
+        thread, so sharing one connection keeps SQLite's page cache hot
+        without needing extra locking around individual queries.
+        """
+        if self._conn is None:
+            async with self._conn_lock:
+                if self._conn is None:
+                    # cached_statements keeps every recurring query's compiled
+                    # plan alive for the life of the shared connection.
+                    conn = await aiosqlite.connect(self.db_path, cached_statements=256)
+                    conn.row_factory = aiosqlite.Row
+                    await conn.executescript(PRAGMA_SCRIPT)
+                    self._conn = conn
+        yield self._conn
+
+    async def close(self):
+        """Closes the shared connection on shutdown."""
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
 
     def init_database(self):
-        """Initializes the database schema if tables don't exist."""
-        with self.get_conn() as conn:
+        """Initializes the database schema if tables don't exist. Runs synchronously at startup."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executescript(PRAGMA_SCRIPT)
             cursor = conn.cursor()
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS verified_users (
@@ -77,103 +196,211 @@ class DatabaseManager:
                     chat_id INTEGER UNIQUE
                 )
             ''')
+            # Keep the recurring scans (pending-request lookups, stats counts)
+            # on index range scans instead of full table scans.
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_join_requests_status ON join_requests(status, user_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_verified_users_banned ON verified_users(is_banned)')
+            # Partial index over the active users only; is_verified and the
+            # cache preload filter on is_banned = FALSE, so these become
+            # index-only scans over a smaller tree.
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_verified_users_active ON verified_users(user_id) WHERE is_banned = FALSE')
             conn.commit()
+        finally:
+            conn.close()
 
-    def add_verified_user(self, user_id: int, username: str, first_name: str, phone_number: str):
-        with self.get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT OR REPLACE INTO verified_users 
-                (user_id, username, first_name, phone_number, verified_date, is_banned)
-                VALUES (?, ?, ?, ?, ?, FALSE)
-            ''', (user_id, username or "", first_name or "", phone_number, datetime.now()))
-            conn.commit()
-
-    def is_verified(self, user_id: int) -> bool:
-        with self.get_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT 1 FROM verified_users WHERE user_id = ? AND is_banned = FALSE', (user_id,))
-            return cursor.fetchone() is not None
-
-    def ban_user(self, user_id: int):
-        with self.get_conn() as conn:
-            conn.cursor().execute('UPDATE verified_users SET is_banned = TRUE WHERE user_id = ?', (user_id,))
-            conn.commit()
-
-    def get_all_groups(self) -> List[Dict[str, Any]]:
-        with self.get_conn() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('SELECT id, name, description, link, chat_id FROM managed_groups ORDER BY id')
-            return [dict(row) for row in cursor.fetchall()]
+    def _cache_verified(self, user_id: int, verified: bool):
+        self._verified_cache[user_id] = (verified, time.monotonic())
+        self._verified_cache.move_to_end(user_id)
+        if len(self._verified_cache) > self._verified_cache_max:
+            self._verified_cache.popitem(last=False)
 
-    def add_group(self, name: str, description: str, link: str) -> bool:
+    async def add_verified_user(self, user_id: int, username: str, first_name: str, phone_number: str):
+        async with self.get_conn() as conn:
+            await conn.execute('''
+                INSERT INTO verified_users
+                (user_id, username, first_name, phone_number, verified_date, is_banned)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, FALSE)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    username = excluded.username,
+                    first_name = excluded.first_name,
+                    phone_number = excluded.phone_number,
+                    verified_date = excluded.verified_date,
+                    is_banned = FALSE
+            ''', (user_id, username or "", first_name or "", phone_number))
+            await conn.commit()
+        self._cache_verified(user_id, True)
+
+    async def preload_verified_cache(self):
+        """Warms the verified-user cache at startup so early traffic skips SQLite."""
+        async with self.get_conn() as conn:
+            async with conn.execute('SELECT user_id FROM verified_users WHERE is_banned = FALSE') as cursor:
+                async for row in cursor:
+                    self._cache_verified(row[0], True)
+        logger.info("Preloaded %d verified users into cache", len(self._verified_cache))
+
+    async def is_verified(self, user_id: int) -> bool:
+        cached = self._verified_cache.get(user_id)
+        if cached is not None and time.monotonic() - cached[1] < self._verified_cache_ttl:
+            self._verified_cache.move_to_end(user_id)
+            return cached[0]
+        async with self.get_conn() as conn:
+            async with conn.execute('SELECT 1 FROM verified_users WHERE user_id = ? AND is_banned = FALSE', (user_id,)) as cursor:
+                verified = await cursor.fetchone() is not None
+        self._cache_verified(user_id, verified)
+        return verified
+
+    async def ban_user(self, user_id: int):
+        async with self.get_conn() as conn:
+            await conn.execute('UPDATE verified_users SET is_banned = TRUE WHERE user_id = ?', (user_id,))
+            await conn.commit()
+        self._cache_verified(user_id, False)
+
+    async def get_all_groups(self) -> List[Dict[str, Any]]:
+        async with self.get_conn() as conn:
+            async with conn.execute('SELECT id, name, description, link, chat_id FROM managed_groups ORDER BY id') as cursor:
+                return [dict(row) for row in await cursor.fetchall()]
+
+    async def add_group(self, name: str, description: str, link: str) -> bool:
         """Adds input validation before database insertion."""
         if not name.strip() or not link.strip():
             logger.error("Group name and link cannot be empty.")
             return False
         if not link.startswith(('https://t.me/', 'http://t.me/')):
-            logger.error(f"Invalid Telegram link format: {link}")
+            logger.error("Invalid Telegram link format: %s", link)
             return False
             
         try:
-            with self.get_conn() as conn:
-                conn.cursor().execute('INSERT INTO managed_groups (name, description, link) VALUES (?, ?, ?)', (name, description, link))
-                conn.commit()
+            async with self.get_conn() as conn:
+                await conn.execute('INSERT INTO managed_groups (name, description, link) VALUES (?, ?, ?)', (name, description, link))
+                await conn.commit()
             return True
         except sqlite3.IntegrityError:
-            logger.warning(f"Attempted to add a group with a duplicate link: {link}")
+            logger.warning("Attempted to add a group with a duplicate link: %s", link)
             return False
 
-    def remove_group(self, group_id: int) -> Optional[Dict[str, Any]]:
-        with self.get_conn() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM managed_groups WHERE id = ?', (group_id,))
-            group = cursor.fetchone()
+    async def remove_group(self, group_id: int) -> Optional[Dict[str, Any]]:
+        async with self.get_conn() as conn:
+            async with conn.execute('SELECT * FROM managed_groups WHERE id = ?', (group_id,)) as cursor:
+                group = await cursor.fetchone()
             if group:
-                cursor.execute('DELETE FROM managed_groups WHERE id = ?', (group_id,))
-                conn.commit()
+                await conn.execute('DELETE FROM managed_groups WHERE id = ?', (group_id,))
+                await conn.commit()
                 return dict(group)
             return None
-    
-    def update_chat_id_by_link(self, link: str, chat_id: int):
-        with self.get_conn() as conn:
-            conn.cursor().execute('UPDATE managed_groups SET chat_id = ? WHERE link = ?', (chat_id, link))
-            conn.commit()
-            logger.info(f"Updated chat_id for group with link {link} to {chat_id}")
-
-    def add_join_request(self, user_id: int, chat_id: int):
-        with self.get_conn() as conn:
-            conn.cursor().execute("INSERT OR REPLACE INTO join_requests (user_id, chat_id, request_date, status) VALUES (?, ?, ?, 'pending')", (user_id, chat_id, datetime.now()))
-            conn.commit()
 
-    def update_join_request_status(self, user_id: int, chat_id: int, status: str):
-        with self.get_conn() as conn:
-            conn.cursor().execute("UPDATE join_requests SET status = ? WHERE user_id = ? AND chat_id = ?", (status, user_id, chat_id))
-            conn.commit()
-
-    def get_user_info(self, user_id: int) -> Optional[Dict[str, Any]]:
+    async def update_chat_id_by_link(self, link: str, chat_id: int):
+        async with self.get_conn() as conn:
+            await conn.execute('UPDATE managed_groups SET chat_id = ? WHERE link = ?', (chat_id, link))
+            await conn.commit()
+            logger.info("Updated chat_id for group with link %s to %s", link, chat_id)
+
+    async def add_join_request(self, user_id: int, chat_id: int):
+        async with self.get_conn() as conn:
+            await conn.execute('''
+                INSERT INTO join_requests (user_id, chat_id, request_date, status)
+                VALUES (?, ?, CURRENT_TIMESTAMP, 'pending')
+                ON CONFLICT(user_id, chat_id) DO UPDATE SET
+                    request_date = excluded.request_date,
+                    status = 'pending'
+            ''', (user_id, chat_id))
+            await conn.commit()
+
+    async def update_join_request_status(self, user_id: int, chat_id: int, status: str):
+        async with self.get_conn() as conn:
+            await conn.execute("UPDATE join_requests SET status = ? WHERE user_id = ? AND chat_id = ?", (status, user_id, chat_id))
+            await conn.commit()
+
+    async def update_join_request_statuses(self, rows: List[tuple]):
+        """Applies many (status, user_id, chat_id) updates in one transaction."""
+        if not rows:
+            return
+        async with self.get_conn() as conn:
+            await conn.executemany("UPDATE join_requests SET status = ? WHERE user_id = ? AND chat_id = ?", rows)
+            await conn.commit()
+
+    async def get_stats(self) -> Dict[str, int]:
+        """Collects the counters shown by /stats."""
+        async with self.get_conn() as conn:
+            async with conn.execute('''
+                SELECT
+                    (SELECT COUNT(*) FROM verified_users WHERE is_banned = FALSE),
+                    (SELECT COUNT(*) FROM verified_users WHERE is_banned = TRUE),
+                    (SELECT COUNT(*) FROM managed_groups),
+                    (SELECT COUNT(*) FROM join_requests WHERE status = 'pending')
+            ''') as cursor:
+                verified_count, banned_count, groups_count, pending_requests = await cursor.fetchone()
+        return {
+            'verified_count': verified_count,
+            'banned_count': banned_count,
+            'groups_count': groups_count,
+            'pending_requests': pending_requests,
+        }
+
+    async def get_user_info(self, user_id: int) -> Optional[Dict[str, Any]]:
         """Get user information from verified_users table."""
-        with self.get_conn() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM verified_users WHERE user_id = ?', (user_id,))
-            result = cursor.fetchone()
-            return dict(result) if result else None
+        async with self.get_conn() as conn:
+            async with conn.execute('SELECT * FROM verified_users WHERE user_id = ?', (user_id,)) as cursor:
+                result = await cursor.fetchone()
+                return dict(result) if result else None
+
+# Matches the common PH mobile spellings (+639XXXXXXXXX, 639..., 09..., 9...)
+# so the frequent case can skip the full phonenumbers parse.
+# Single-pass removal of the separators people paste into phone numbers.
+_PHONE_STRIP = str.maketrans('', '', ' -()')
+PH_MOBILE_RE = re.compile(r'(?:\+?63|0)?(9\d{9})')
+
+
+class TokenBucket:
+    """Minimal async token bucket used to pace bursts of outgoing Telegram calls."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Waits until a token is available, then consumes it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+@functools.lru_cache(maxsize=4096)
+def _verify_phone_number(phone_number: str) -> tuple:
+    """Cached (is_filipino, formatted_number) check; pure function of the input."""
+    cleaned = phone_number.translate(_PHONE_STRIP)
+    match = PH_MOBILE_RE.fullmatch(cleaned)
+    if match:
+        # Normalize to the same international format phonenumbers produces,
+        # without paying for metadata-driven parsing on the hot path.
+        digits = match.group(1)
+        return True, f"+63 {digits[:3]} {digits[3:6]} {digits[6:]}"
+    # A foreign country code can never verify; reject it without paying for
+    # phonenumbers' metadata-driven parse.
+    if cleaned.startswith('+') and not cleaned.startswith('+63'):
+        return False, phone_number
+    try:
+        parsed = phonenumbers.parse(phone_number, 'PH')
+        is_valid = phonenumbers.is_valid_number(parsed)
+        is_ph = phonenumbers.region_code_for_number(parsed) == 'PH'
+
+        return is_valid and is_ph, phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL)
+    except NumberParseException:
+        return False, phone_number
 
 class PhoneVerifier:
     @staticmethod
     def verify_phone_number(phone_number: str) -> dict:
         """Verify if a phone number is from the Philippines using a region hint."""
-        try:
-            parsed = phonenumbers.parse(phone_number, 'PH')
-            is_valid = phonenumbers.is_valid_number(parsed)
-            is_ph = phonenumbers.region_code_for_number(parsed) == 'PH'
-            
-            return {'is_filipino': is_valid and is_ph, 'formatted_number': phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.INTERNATIONAL)}
-        except NumberParseException:
-            return {'is_filipino': False, 'formatted_number': phone_number}
+        is_filipino, formatted_number = _verify_phone_number(phone_number)
+        return {'is_filipino': is_filipino, 'formatted_number': formatted_number}
 
 class FilipinoBotManager:
     def __init__(self):
@@ -184,213 +411,282 @@ class FilipinoBotManager:
         self.verifier = PhoneVerifier()
         self._groups_lock = threading.Lock()
         self.filipino_groups = []
-        self.refresh_groups_cache()
+        self._groups_text = self._build_groups_text([])
+        # Paces fan-out API calls (approvals, bulk bans) just under
+        # Telegram's ~30 requests/second global budget.
+        self.send_limiter = TokenBucket(rate=25, capacity=25)
+        # Admin notifications are queued and coalesced off the hot path so
+        # handlers never wait on an extra round-trip to the admin chat.
+        self._admin_queue: asyncio.Queue = asyncio.Queue()
+        self._admin_notifier_task: Optional[asyncio.Task] = None
+        # Chat titles change rarely; cache them so pending-request approval
+        # doesn't pay a get_chat round-trip per chat.
+        self._chat_title_cache: OrderedDict[int, tuple] = OrderedDict()
+        # Absorbs bursts of /stats polling without re-running the counts.
+        self._stats_cache: tuple = (0.0, None)
+        # With concurrent updates enabled, serialize each user's own
+        # verification/join handling so double-taps can't interleave.
+        self._user_locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def post_init(self, application: Application):
+        """Async startup work that must happen after the event loop is running."""
+        await self.refresh_groups_cache()
+        await self.db.preload_verified_cache()
+        self._admin_notifier_task = asyncio.create_task(self._admin_notifier_loop(application.bot))
+
+    async def post_shutdown(self, application: Application):
+        """Releases resources when the application stops."""
+        if self._admin_notifier_task is not None:
+            self._admin_notifier_task.cancel()
+        await self.db.close()
+
+    async def get_chat_title(self, bot, chat_id: int) -> str:
+        """Returns a chat's title, cached for a day to avoid repeat get_chat calls."""
+        cached = self._chat_title_cache.get(chat_id)
+        if cached is not None and time.monotonic() - cached[0] < 86400:
+            self._chat_title_cache.move_to_end(chat_id)
+            return cached[1]
+        # The managed-groups cache already knows the stored name for our own
+        # groups; only unknown chats cost a get_chat round-trip.
+        with self._groups_lock:
+            for group in self.filipino_groups:
+                if group['chat_id'] == chat_id:
+                    return group['name']
+        chat = await bot.get_chat(chat_id)
+        self._chat_title_cache[chat_id] = (time.monotonic(), chat.title)
+        self._chat_title_cache.move_to_end(chat_id)
+        if len(self._chat_title_cache) > 4096:
+            self._chat_title_cache.popitem(last=False)
+        return chat.title
+
+    def notify_admin(self, text: str):
+        """Queues a notification for the admin without blocking the caller."""
+        self._admin_queue.put_nowait(text)
+
+    async def _admin_notifier_loop(self, bot):
+        """Drains queued admin notifications, coalescing bursts into one message."""
+        while True:
+            batch = [await self._admin_queue.get()]
+            try:
+                # Give a burst a few seconds to accumulate before sending.
+                await asyncio.sleep(5)
+                while not self._admin_queue.empty() and len(batch) < 10:
+                    batch.append(self._admin_queue.get_nowait())
+                await self.send_limiter.acquire()
+                # Plain-text, silent delivery: these are log-style pings, so
+                # skip server-side markdown parsing and the notification buzz.
+                await bot.send_message(ADMIN_ID, "\n\n".join(batch), disable_notification=True)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Failed to deliver admin notifications: %s", e)
 
-    def refresh_groups_cache(self):
+    async def refresh_groups_cache(self):
         """Reloads the group list from the database safely."""
+        groups = await self.db.get_all_groups()
         with self._groups_lock:
-            self.filipino_groups = self.db.get_all_groups()
-            logger.info("Refreshed groups cache from database.")
+            self.filipino_groups = groups
+            self._groups_text = self._build_groups_text(groups)
+        logger.info("Refreshed groups cache from database.")
+
+    @staticmethod
+    def _build_groups_text(groups: List[Dict[str, Any]]) -> str:
+        """Formats the group list once per cache refresh."""
+        if not groups:
+            return "🔍 No groups available at the moment."
+
+        message = "🇵🇭 **Available Filipino Groups:**\n\n"
+        for group in groups:
+            message += f"**- {group['name']}**\n"
+            message += f"  📝 {group['description']}\n"
+            message += f"  🔗 {group['link']}\n\n"
+
+        message += "💡 **Tip:** Verified users are auto-approved!"
+        return message
             
     def format_available_groups(self) -> str:
-        """Reads from the thread-safe cache to format the group list."""
+        """Returns the pre-rendered group list from the thread-safe cache."""
         with self._groups_lock:
-            if not self.filipino_groups:
-                return "🔍 No groups available at the moment."
-            
-            message = "🇵🇭 **Available Filipino Groups:**\n\n"
-            for group in self.filipino_groups:
-                message += f"**- {group['name']}**\n"
-                message += f"  📝 {group['description']}\n"
-                message += f"  🔗 {group['link']}\n\n"
-            
-            message += "💡 **Tip:** Verified users are auto-approved!"
-            return message
+            return self._groups_text
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         user = update.effective_user
-        if self.db.is_verified(user.id):
+        if await self.db.is_verified(user.id):
             await update.message.reply_text(
-                "✅ *Na-verify ka na!*\n\n" + self.format_available_groups(),
+                ALREADY_VERIFIED_TMPL.format(groups=self.format_available_groups()),
                 parse_mode=ParseMode.MARKDOWN,
                 disable_web_page_preview=True
             )
         else:
-            contact_keyboard = [[KeyboardButton("📱 Share My Phone Number", request_contact=True)]]
-            contact_markup = ReplyKeyboardMarkup(contact_keyboard, one_time_keyboard=True, resize_keyboard=True)
             await update.message.reply_text(
-                f"🇵🇭 *Filipino Verification*\n\nHi {user.first_name}! To join our exclusive Filipino groups, please verify your identity by sharing your Philippine phone number.",
-                reply_markup=contact_markup,
+                VERIFICATION_PROMPT_TMPL.format(first_name=user.first_name),
+                reply_markup=CONTACT_KEYBOARD,
                 parse_mode=ParseMode.MARKDOWN
             )
 
     async def handle_contact_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        user = update.effective_user
+        async with self._user_locks[user.id]:
+            await self._handle_contact_message(update, context)
+
+    async def _handle_contact_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         contact = update.message.contact
         user = update.effective_user
 
         if contact.user_id != user.id:
-            await update.message.reply_text("❌ Please share your own contact information.", reply_markup=ReplyKeyboardRemove())
+            await update.message.reply_text("❌ Please share your own contact information.", reply_markup=KEYBOARD_REMOVE)
             return
-        
+
+        # Accidental re-shares from verified users are common; answer
+        # idempotently without re-verifying or rewriting the row.
+        if await self.db.is_verified(user.id):
+            await update.message.reply_text(
+                ALREADY_VERIFIED_TMPL.format(groups=self.format_available_groups()),
+                parse_mode=ParseMode.MARKDOWN,
+                disable_web_page_preview=True,
+                reply_markup=KEYBOARD_REMOVE
+            )
+            return
+
         phone_result = self.verifier.verify_phone_number(contact.phone_number)
         
         if phone_result['is_filipino']:
-            self.db.add_verified_user(user.id, user.username, user.first_name, contact.phone_number)
-            success_msg = f"✅ **VERIFIED!** 🇵🇭\n\nWelcome, {user.first_name}!\n\nYour number {phone_result['formatted_number']} is verified. You now have access to all our groups and will be auto-approved.\n\n{self.format_available_groups()}"
-            await update.message.reply_text(success_msg, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True, reply_markup=ReplyKeyboardRemove())
-            await context.bot.send_message(ADMIN_ID, f"✅ New Verified User: {user.first_name} (@{user.username or 'N/A'}), ID: `{user.id}`", parse_mode=ParseMode.MARKDOWN)
-            
-            # Auto-approve any pending join requests for this newly verified user
-            await self.approve_pending_requests(context, user.id)
-            
+            await self.db.add_verified_user(user.id, user.username, user.first_name, contact.phone_number)
+            success_msg = VERIFY_SUCCESS_TMPL.format(first_name=user.first_name, formatted_number=phone_result['formatted_number'], groups=self.format_available_groups())
+            self.notify_admin(f"✅ New Verified User: {user.first_name} (@{user.username or 'N/A'}), ID: {user.id}")
+
+            # The success DM and the pending-approval sweep touch different
+            # chats, so run them concurrently instead of back-to-back.
+            results = await asyncio.gather(
+                update.message.reply_text(success_msg, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True, reply_markup=KEYBOARD_REMOVE),
+                self.approve_pending_requests(context, user.id),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Post-verification send failed for user %s: %s", user.id, result)
+
         else:
-            fail_msg = f"❌ **Verification Failed**\n\nThe number you provided ({phone_result['formatted_number']}) is not recognized as a Philippine number. Please try again with a valid PH number."
-            await update.message.reply_text(fail_msg, reply_markup=ReplyKeyboardRemove())
+            fail_msg = VERIFY_FAIL_TMPL.format(formatted_number=phone_result['formatted_number'])
+            await update.message.reply_text(fail_msg, reply_markup=KEYBOARD_REMOVE)
 
     async def approve_pending_requests(self, context: ContextTypes.DEFAULT_TYPE, user_id: int):
         """Auto-approve any pending join requests for a newly verified user."""
         try:
-            with self.db.get_conn() as conn:
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT chat_id FROM join_requests WHERE user_id = ? AND status = 'pending'", 
+            async with self.db.get_conn() as conn:
+                async with conn.execute(
+                    "SELECT chat_id FROM join_requests WHERE user_id = ? AND status = 'pending'",
                     (user_id,)
-                )
-                pending_requests = cursor.fetchall()
-                
-                for (chat_id,) in pending_requests:
+                ) as cursor:
+                    pending_requests = await cursor.fetchall()
+
+            if not pending_requests:
+                return
+
+            # Approve concurrently so network latency overlaps; the semaphore
+            # keeps the burst well below Telegram's global send limit.
+            semaphore = asyncio.Semaphore(20)
+
+            async def approve_one(chat_id: int):
+                async with semaphore:
                     try:
                         # Try to approve the pending request
-                        await context.bot.approve_chat_join_request(chat_id=chat_id, user_id=user_id)
-                        self.db.update_join_request_status(user_id, chat_id, "approved")
-                        
+                        await self.send_limiter.acquire()
+                        try:
+                            await context.bot.approve_chat_join_request(chat_id=chat_id, user_id=user_id)
+                        except RetryAfter as e:
+                            # Flood control: back off exactly as long as Telegram asks, then retry once.
+                            await asyncio.sleep(e.retry_after)
+                            await context.bot.approve_chat_join_request(chat_id=chat_id, user_id=user_id)
+
                         # Get chat info for welcome message
                         try:
-                            chat = await context.bot.get_chat(chat_id)
+                            chat_title = await self.get_chat_title(context.bot, chat_id)
+                            await self.send_limiter.acquire()
                             await context.bot.send_message(
                                 chat_id=user_id,
-                                text=f"🎉 **Automatically Approved!**\n\nYou've been approved to join **{chat.title}** since you're now a verified Filipino user! 🇵🇭",
+                                text=AUTO_APPROVED_TMPL.format(chat_title=chat_title),
                                 parse_mode=ParseMode.MARKDOWN
                             )
-                            
+
                             # Notify admin
-                            await context.bot.send_message(
-                                ADMIN_ID,
-                                f"🎉 Auto-approved pending request: User {user_id} for {chat.title}",
-                                parse_mode=ParseMode.MARKDOWN
-                            )
-                            
+                            self.notify_admin(f"🎉 Auto-approved pending request: User {user_id} for {chat_title}")
+
                         except Exception as e:
-                            logger.warning(f"Could not send auto-approval message: {e}")
-                            
-                        logger.info(f"Auto-approved pending request for user {user_id} to chat {chat_id}")
-                        
+                            logger.warning("Could not send auto-approval message: %s", e)
+
+                        logger.info("Auto-approved pending request for user %s to chat %s", user_id, chat_id)
+
                     except Exception as e:
-                        logger.error(f"Failed to approve pending request for user {user_id} to chat {chat_id}: {e}")
-                        self.db.update_join_request_status(user_id, chat_id, "error")
-                        
+                        logger.error("Failed to approve pending request for user %s to chat %s: %s", user_id, chat_id, e)
+                        return ("error", user_id, chat_id)
+
+                    return ("approved", user_id, chat_id)
+
+            results = await asyncio.gather(*(approve_one(chat_id) for (chat_id,) in pending_requests))
+            # One transaction (and one fsync) for the whole batch instead of
+            # a commit per approved chat.
+            await self.db.update_join_request_statuses(list(results))
+
         except Exception as e:
-            logger.error(f"Error checking pending requests for user {user_id}: {e}")
+            logger.error("Error checking pending requests for user %s: %s", user_id, e)
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        help_text = "🤖 **Bot Commands:**\n\n`/start` - Start the verification process.\n`/groups` - View available Filipino groups (for verified users).\n`/help` - Show this help message."
+        help_text = HELP_TEXT
         
         if update.effective_user.id == ADMIN_ID:
-            help_text += "\n\n**Admin Commands:**\n`/ban <user_id>` - Ban a user\n`/manage_groups` - Manage groups\n`/stats` - Show bot statistics"
+            help_text += HELP_ADMIN_SUFFIX
         
         await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
 
     async def groups_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        if self.db.is_verified(update.effective_user.id):
+        if await self.db.is_verified(update.effective_user.id):
             await update.message.reply_text(self.format_available_groups(), parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
         else:
             await update.message.reply_text("❌ You must be a verified user to see the list of groups. Please use /start to begin verification.")
 
     async def ban_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        if update.effective_user.id != ADMIN_ID: 
-            await update.message.reply_text("❌ You don't have permission to use this command.")
-            return
-            
         if not context.args:
             await update.message.reply_text("Usage: `/ban <user_id>`", parse_mode=ParseMode.MARKDOWN)
             return
             
         try:
             user_id = int(context.args[0])
-            self.db.ban_user(user_id)
+            await self.db.ban_user(user_id)
             await update.message.reply_text(f"🚫 User `{user_id}` is now banned.", parse_mode=ParseMode.MARKDOWN)
             
-            # Remove banned user from all groups
+            # Remove banned user from all groups. Snapshot the list under the
+            # lock and do the network calls outside it: holding a threading
+            # lock across an await would block every handler that touches the
+            # groups cache and deadlock the event loop.
             with self._groups_lock:
-                for group in self.filipino_groups:
-                    if group['chat_id']:
-                        try:
-                            await context.bot.ban_chat_member(chat_id=group['chat_id'], user_id=user_id)
-                            logger.info(f"Banned user {user_id} from group {group['name']}")
-                        except Exception as e:
-                            logger.error(f"Failed to kick banned user {user_id} from {group['name']}: {e}")
+                groups = [g for g in self.filipino_groups if g['chat_id']]
+            for group in groups:
+                try:
+                    await self.send_limiter.acquire()
+                    await context.bot.ban_chat_member(chat_id=group['chat_id'], user_id=user_id)
+                    logger.info("Banned user %s from group %s", user_id, group['name'])
+                except Exception as e:
+                    logger.error("Failed to kick banned user %s from %s: %s", user_id, group['name'], e)
         except (ValueError, IndexError):
             await update.message.reply_text("❌ Invalid user ID. Please provide a valid numeric user ID.")
 
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show bot statistics (Admin only)."""
-        if update.effective_user.id != ADMIN_ID:
-            await update.message.reply_text("❌ You don't have permission to use this command.")
-            return
-
-        with self.db.get_conn() as conn:
-            cursor = conn.cursor()
-            
-            # Get verified users count
-            cursor.execute('SELECT COUNT(*) FROM verified_users WHERE is_banned = FALSE')
-            verified_count = cursor.fetchone()[0]
-            
-            # Get banned users count
-            cursor.execute('SELECT COUNT(*) FROM verified_users WHERE is_banned = TRUE')
-            banned_count = cursor.fetchone()[0]
-            
-            # Get groups count
-            cursor.execute('SELECT COUNT(*) FROM managed_groups')
-            groups_count = cursor.fetchone()[0]
-            
-            # Get pending join requests
-            cursor.execute('SELECT COUNT(*) FROM join_requests WHERE status = "pending"')
-            pending_requests = cursor.fetchone()[0]
-
-        stats_text = f"""📊 **Bot Statistics**
-
-👥 **Users:**
-• Verified: {verified_count}
-• Banned: {banned_count}
-
-🏢 **Groups:** {groups_count}
-
-⏳ **Pending Join Requests:** {pending_requests}
-"""
+        cached_at, cached_text = self._stats_cache
+        if cached_text is not None and time.monotonic() - cached_at < 30:
+            stats_text = cached_text
+        else:
+            stats = await self.db.get_stats()
+            stats_text = STATS_TMPL.format(**stats)
+            self._stats_cache = (time.monotonic(), stats_text)
         await update.message.reply_text(stats_text, parse_mode=ParseMode.MARKDOWN)
             
     async def manage_groups_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Admin command to manage groups."""
-        if update.effective_user.id != ADMIN_ID:
-            await update.message.reply_text("❌ You don't have permission to use this command.")
-            return
-
         if not context.args:
             # Show help for manage_groups command
-            help_text = """🏢 **Group Management Commands:**
-
-**Add Group:**
-`/manage_groups add "Group Name" "Description" "https://t.me/grouplink"`
-
-**Remove Group:**
-`/manage_groups remove <group_id>`
-
-**List Groups:**
-`/manage_groups list`
-
-**Refresh Cache:**
-`/manage_groups refresh`
-"""
+            help_text = MANAGE_GROUPS_HELP
             await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
             return
 
@@ -405,8 +701,8 @@ class FilipinoBotManager:
             description = context.args[2].strip('"')
             link = context.args[3].strip('"')
             
-            if self.db.add_group(name, description, link):
-                self.refresh_groups_cache()
+            if await self.db.add_group(name, description, link):
+                await self.refresh_groups_cache()
                 await update.message.reply_text(f"✅ Group **{name}** added successfully!", parse_mode=ParseMode.MARKDOWN)
             else:
                 await update.message.reply_text("❌ Failed to add group. Check if the link is valid and not already in use.")
@@ -418,9 +714,9 @@ class FilipinoBotManager:
             
             try:
                 group_id = int(context.args[1])
-                removed_group = self.db.remove_group(group_id)
+                removed_group = await self.db.remove_group(group_id)
                 if removed_group:
-                    self.refresh_groups_cache()
+                    await self.refresh_groups_cache()
                     await update.message.reply_text(f"✅ Group **{removed_group['name']}** removed successfully!", parse_mode=ParseMode.MARKDOWN)
                 else:
                     await update.message.reply_text("❌ Group not found.")
@@ -428,7 +724,7 @@ class FilipinoBotManager:
                 await update.message.reply_text("❌ Please provide a valid group ID.")
 
         elif action == "list":
-            groups = self.db.get_all_groups()
+            groups = await self.db.get_all_groups()
             if not groups:
                 await update.message.reply_text("📝 No groups found.")
                 return
@@ -444,7 +740,7 @@ class FilipinoBotManager:
             await update.message.reply_text(message, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
 
         elif action == "refresh":
-            self.refresh_groups_cache()
+            await self.refresh_groups_cache()
             await update.message.reply_text("✅ Groups cache refreshed successfully!")
 
         else:
@@ -452,74 +748,63 @@ class FilipinoBotManager:
             
     async def handle_join_request(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle join requests to groups."""
+        async with self._user_locks[update.chat_join_request.from_user.id]:
+            await self._handle_join_request(update, context)
+
+    async def _handle_join_request(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         join_request: ChatJoinRequest = update.chat_join_request
         user = join_request.from_user
         chat = join_request.chat
         
-        logger.info(f"Join request from {user.first_name} (@{user.username}) to {chat.title}")
+        logger.info("Join request from %s (@%s) to %s", user.first_name, user.username, chat.title)
         
         # Log the join request
-        self.db.add_join_request(user.id, chat.id)
+        await self.db.add_join_request(user.id, chat.id)
         
         # Check if user is verified
-        if self.db.is_verified(user.id):
+        if await self.db.is_verified(user.id):
             try:
                 # Auto-approve verified users
                 await context.bot.approve_chat_join_request(chat_id=chat.id, user_id=user.id)
-                self.db.update_join_request_status(user.id, chat.id, "approved")
+                await self.db.update_join_request_status(user.id, chat.id, "approved")
                 
                 # Welcome message
                 try:
                     await context.bot.send_message(
                         chat_id=user.id,
-                        text=f"✅ Welcome to **{chat.title}**! You've been automatically approved as a verified Filipino user. 🇵🇭",
+                        text=JOIN_WELCOME_TMPL.format(chat_title=chat.title),
                         parse_mode=ParseMode.MARKDOWN
                     )
                 except Exception as e:
-                    logger.warning(f"Could not send welcome message to {user.id}: {e}")
+                    logger.warning("Could not send welcome message to %s: %s", user.id, e)
                 
                 # Notify admin
-                await context.bot.send_message(
-                    ADMIN_ID,
-                    f"✅ Auto-approved verified user: {user.first_name} (@{user.username or 'N/A'}) to {chat.title}",
-                    parse_mode=ParseMode.MARKDOWN
-                )
+                self.notify_admin(f"✅ Auto-approved verified user: {user.first_name} (@{user.username or 'N/A'}) to {chat.title}")
                 
-                logger.info(f"Auto-approved verified user {user.id} to {chat.title}")
+                logger.info("Auto-approved verified user %s to %s", user.id, chat.title)
                 
             except Exception as e:
-                logger.error(f"Failed to approve join request: {e}")
-                self.db.update_join_request_status(user.id, chat.id, "error")
+                logger.error("Failed to approve join request: %s", e)
+                await self.db.update_join_request_status(user.id, chat.id, "error")
         else:
             # DON'T decline - keep request pending and guide user to verify
             try:
                 # Just inform user how to get verified - DON'T decline the request
                 await context.bot.send_message(
                     chat_id=user.id,
-                    text=f"⏳ **Verification Required for {chat.title}**\n\nHi {user.first_name}! Your join request is **pending**.\n\nTo get automatically approved, you need to verify your Philippine phone number first.\n\n👉 Start verification by messaging me with /start\n\n✅ Once verified, you'll be **automatically approved** without needing to request again!",
+                    text=PENDING_VERIFICATION_TMPL.format(chat_title=chat.title, first_name=user.first_name),
                     parse_mode=ParseMode.MARKDOWN
                 )
                 
                 # Notify admin about pending request
-                await context.bot.send_message(
-                    ADMIN_ID,
-                    f"⏳ Pending verification: {user.first_name} (@{user.username or 'N/A'}) wants to join {chat.title}",
-                    parse_mode=ParseMode.MARKDOWN
-                )
+                self.notify_admin(f"⏳ Pending verification: {user.first_name} (@{user.username or 'N/A'}) wants to join {chat.title}")
                 
-                logger.info(f"User {user.id} request pending verification for {chat.title}")
+                logger.info("User %s request pending verification for %s", user.id, chat.title)
                 
             except Exception as e:
-                logger.warning(f"Could not send verification message to {user.id}: {e}")
+                logger.warning("Could not send verification message to %s: %s", user.id, e)
                 # Still notify admin even if we can't message the user
-                try:
-                    await context.bot.send_message(
-                        ADMIN_ID,
-                        f"⏳ Pending verification (no DM): {user.first_name} (@{user.username or 'N/A'}) wants to join {chat.title}",
-                        parse_mode=ParseMode.MARKDOWN
-                    )
-                except:
-                    pass
+                self.notify_admin(f"⏳ Pending verification (no DM): {user.first_name} (@{user.username or 'N/A'}) wants to join {chat.title}")
         
     async def handle_chat_member_update(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle chat member updates (users joining/leaving groups)."""
@@ -531,16 +816,12 @@ class FilipinoBotManager:
         
         # Log member status changes
         if old_status != new_status:
-            logger.info(f"User {user.first_name} ({user.id}) status changed from {old_status} to {new_status} in {chat.title}")
+            logger.info("User %s (%s) status changed from %s to %s in %s", user.first_name, user.id, old_status, new_status, chat.title)
             
             # If user was banned, update their status
             if new_status == ChatMemberStatus.BANNED:
-                self.db.ban_user(user.id)
-                await context.bot.send_message(
-                    ADMIN_ID,
-                    f"🚫 User {user.first_name} (@{user.username or 'N/A'}) was banned from {chat.title}",
-                    parse_mode=ParseMode.MARKDOWN
-                )
+                await self.db.ban_user(user.id)
+                self.notify_admin(f"🚫 User {user.first_name} (@{user.username or 'N/A'}) was banned from {chat.title}")
 
     async def handle_my_chat_member_update(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle updates to the bot's own membership status."""
@@ -549,7 +830,7 @@ class FilipinoBotManager:
         old_status = chat_member_update.old_chat_member.status
         new_status = chat_member_update.new_chat_member.status
         
-        logger.info(f"Bot status changed from {old_status} to {new_status} in {chat.title}")
+        logger.info("Bot status changed from %s to %s in %s", old_status, new_status, chat.title)
         
         # If bot was added to a group, try to update the chat_id in database
         if new_status in [ChatMemberStatus.MEMBER, ChatMemberStatus.ADMINISTRATOR]:
@@ -558,12 +839,12 @@ class FilipinoBotManager:
             try:
                 # Try to get the primary invite link
                 invite_link = await context.bot.export_chat_invite_link(chat.id)
-                logger.info(f"Got invite link for {chat.title}: {invite_link}")
+                logger.info("Got invite link for %s: %s", chat.title, invite_link)
             except Exception as e:
-                logger.warning(f"Could not get invite link for {chat.title}: {e}")
+                logger.warning("Could not get invite link for %s: %s", chat.title, e)
             
             # Try to match with stored groups
-            groups = self.db.get_all_groups()
+            groups = await self.db.get_all_groups()
             updated = False
             
             for group in groups:
@@ -583,42 +864,61 @@ class FilipinoBotManager:
                 # 3. Try to match by chat title (fallback, less reliable)
                 elif not updated and group['name'].lower() == chat.title.lower():
                     match_found = True
-                    logger.warning(f"Matched group by title (less reliable): {chat.title}")
+                    logger.warning("Matched group by title (less reliable): %s", chat.title)
                 
                 if match_found:
-                    self.db.update_chat_id_by_link(group['link'], chat.id)
-                    self.refresh_groups_cache()
+                    await self.db.update_chat_id_by_link(group['link'], chat.id)
+                    await self.refresh_groups_cache()
                     updated = True
-                    logger.info(f"Updated chat_id for group '{group['name']}' to {chat.id}")
+                    logger.info("Updated chat_id for group '%s' to %s", group['name'], chat.id)
                     break
             
             if not updated:
-                logger.warning(f"Could not match group {chat.title} (ID: {chat.id}) with any stored group")
+                logger.warning("Could not match group %s (ID: %s) with any stored group", chat.title, chat.id)
             
-            await context.bot.send_message(
-                ADMIN_ID,
-                f"🤖 Bot added to group: **{chat.title}** (ID: `{chat.id}`)\n{'✅ Matched with stored group' if updated else '⚠️ No matching stored group found'}",
-                parse_mode=ParseMode.MARKDOWN
-            )
+            self.notify_admin(f"🤖 Bot added to group: {chat.title} (ID: {chat.id})\n{'✅ Matched with stored group' if updated else '⚠️ No matching stored group found'}")
         
         elif new_status in [ChatMemberStatus.LEFT, ChatMemberStatus.BANNED]:
-            await context.bot.send_message(
-                ADMIN_ID,
-                f"👋 Bot removed from group: **{chat.title}** (ID: `{chat.id}`)",
-                parse_mode=ParseMode.MARKDOWN
-            )
+            self.notify_admin(f"👋 Bot removed from group: {chat.title} (ID: {chat.id})")
 
     def run(self):
         persistence = PicklePersistence(filepath="filipino_bot_persistence")
-        application = Application.builder().token(BOT_TOKEN).persistence(persistence).build()
+        # A generously sized keep-alive pool so concurrent sends (join
+        # approvals, admin notifications) reuse TCP+TLS connections instead
+        # of waiting for a free one or re-handshaking.
+        request = HTTPXRequest(
+            connection_pool_size=64,
+            pool_timeout=10.0,
+            connect_timeout=5.0,
+            read_timeout=20.0,
+        )
+        application = (
+            Application.builder()
+            .token(BOT_TOKEN)
+            .request(request)
+            # getUpdates long-polls on its own small pool so a send burst
+            # can never starve update fetching (and vice versa).
+            .get_updates_request(HTTPXRequest(connection_pool_size=8))
+            .persistence(persistence)
+            .concurrent_updates(True)
+            .post_init(self.post_init)
+            .post_shutdown(self.post_shutdown)
+            .build()
+        )
+
+        # Admin-only commands are filtered at dispatch, so non-admin traffic
+        # never even creates the handler coroutine.
+        admin_filter = filters.User(user_id=ADMIN_ID)
 
         # Command handlers
         application.add_handler(CommandHandler("start", self.start_command))
-        application.add_handler(CommandHandler("help", self.help_command))
-        application.add_handler(CommandHandler("groups", self.groups_command))
-        application.add_handler(CommandHandler("ban", self.ban_command))
-        application.add_handler(CommandHandler("stats", self.stats_command))
-        application.add_handler(CommandHandler("manage_groups", self.manage_groups_command))
+        # Read-only commands run unblocked so they never hold up dispatch;
+        # mutating commands stay blocking to preserve ordering.
+        application.add_handler(CommandHandler("help", self.help_command, block=False))
+        application.add_handler(CommandHandler("groups", self.groups_command, block=False))
+        application.add_handler(CommandHandler("ban", self.ban_command, filters=admin_filter))
+        application.add_handler(CommandHandler("stats", self.stats_command, filters=admin_filter, block=False))
+        application.add_handler(CommandHandler("manage_groups", self.manage_groups_command, filters=admin_filter))
         
         # Message handlers
         application.add_handler(MessageHandler(filters.CONTACT, self.handle_contact_message))
@@ -629,14 +929,18 @@ class FilipinoBotManager:
         application.add_handler(ChatMemberHandler(self.handle_my_chat_member_update, ChatMemberHandler.MY_CHAT_MEMBER))
 
         logger.info("🚀 Filipino Verification Bot (v3.1 - Complete) is starting...")
-        application.run_polling(allowed_updates=Update.ALL_TYPES)
+        # Only request the update types we actually handle, so Telegram
+        # filters the rest server-side before they cost bandwidth or parsing.
+        application.run_polling(
+            allowed_updates=["message", "chat_join_request", "chat_member", "my_chat_member"]
+        )
 
 def main():
     try:
         bot_manager = FilipinoBotManager()
         bot_manager.run()
     except (ValueError, Exception) as e:
-        logger.critical(f"❌ A fatal error occurred: {e}", exc_info=True)
+        logger.critical("❌ A fatal error occurred: %s", e, exc_info=True)
 
 if __name__ == "__main__":
     main()